@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Minimal synchronous Telegram Bot API client
+Used by one-shot scripts that make a single request and don't need an event loop
+"""
+
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Optional, Dict, Any
+
+# Importing telegram_bot is cheap: python-telegram-bot is only loaded on first use
+from telegram_bot import _ENV_FILE as ENV_FILE, _env, _load_env
+
+
+API_URL = "https://api.telegram.org/bot{token}/{method}"
+
+
+class TelegramAPIError(Exception):
+    """Raised when the Bot API answers with ok=false"""
+
+
+def load_config() -> Dict[str, Optional[str]]:
+    """
+    Read bot configuration from .env
+
+    Environment variables take precedence over the file, matching
+    TelegramBotWrapper.
+
+    Returns:
+        Dict with TELEGRAM_BOT_TOKEN and DEFAULT_CHAT_ID
+    """
+    if not ENV_FILE:
+        raise ValueError(
+            "No bot token provided and .env file not found. "
+            "Run 'python scripts/init_bot.py' first."
+        )
+
+    env = _load_env(ENV_FILE)
+    config = {
+        key: _env(env, key)
+        for key in ('TELEGRAM_BOT_TOKEN', 'DEFAULT_CHAT_ID')
+    }
+
+    if not config['TELEGRAM_BOT_TOKEN']:
+        raise ValueError("TELEGRAM_BOT_TOKEN not found in .env file")
+
+    return config
+
+
+def call(method: str, token: Optional[str] = None, **params) -> Any:
+    """
+    Call a Bot API method with a blocking HTTP request
+
+    Args:
+        method: API method name, e.g. 'getMe'
+        token: Bot token. If None, loads from .env file
+        **params: Method parameters
+
+    Returns:
+        The 'result' field of the API response
+    """
+    if token is None:
+        token = load_config()['TELEGRAM_BOT_TOKEN']
+
+    url = API_URL.format(token=token, method=method)
+    data = urllib.parse.urlencode(
+        {key: value for key, value in params.items() if value is not None}
+    ).encode()
+
+    try:
+        with urllib.request.urlopen(url, data=data, timeout=30) as response:
+            payload = json.load(response)
+    except urllib.error.HTTPError as e:
+        # Telegram reports API errors as JSON bodies on 4xx responses
+        try:
+            payload = json.load(e)
+        except ValueError:
+            raise TelegramAPIError(f"HTTP {e.code}: {e.reason}") from e
+
+    if not payload.get('ok'):
+        raise TelegramAPIError(payload.get('description', 'Unknown error'))
+
+    return payload['result']
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for reading recent updates
+Used by list_chats.py and contacts.py import
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Any
+
+
+CACHE_DIR = Path.home() / ".cache" / "telegram-bot"
+
+
+def _cache_file(token: str) -> Path:
+    """Per-bot cache file, named by a hash so the token never hits the disk"""
+    digest = hashlib.sha256(token.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"updates-{digest}.json"
+
+
+def extract_unique_chats(updates: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    """
+    Group updates by chat, keeping the first message seen for each chat
+
+    Args:
+        updates: Updates as returned by TelegramBotWrapper.get_updates
+
+    Returns:
+        Dict mapping chat ID to chat info, sender, latest text and update ID
+    """
+    chats = {}
+    for update in updates:
+        if 'message' in update:
+            msg = update['message']
+            chat_info = msg['chat']
+            chat_id = chat_info['id']
+
+            if chat_id not in chats:
+                chats[chat_id] = {
+                    'chat': chat_info,
+                    'from': msg.get('from'),
+                    'latest_text': msg.get('text') or '(no text)',
+                    'update_id': update['update_id']
+                }
+
+    return chats
+
+
+async def cached_get_updates(ttl_sec: int = 30) -> List[Dict[str, Any]]:
+    """
+    Fetch recent updates, reusing an on-disk copy younger than ttl_sec
+
+    Lets back-to-back CLI calls (e.g. list_chats.py then contacts.py import)
+    share one getUpdates round-trip. Empty responses are not cached, so
+    running again right after messaging the bot picks the message up.
+
+    Args:
+        ttl_sec: Maximum age of the cached response in seconds
+
+    Returns:
+        List of updates
+    """
+    from telegram_bot import TelegramBotWrapper
+
+    bot = TelegramBotWrapper()
+    cache_file = _cache_file(bot.token)
+
+    try:
+        if time.time() - cache_file.stat().st_mtime < ttl_sec:
+            return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        pass
+
+    try:
+        # Interactive commands should not sit in a full long poll when nothing is pending
+        updates = await bot.get_updates(timeout=10)
+    finally:
+        await bot.shutdown()
+
+    if updates:
+        try:
+            CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(updates, ensure_ascii=False))
+        except OSError:
+            # Caching is best effort; the fetched updates are still valid
+            pass
+
+    return updates
@@ -4,18 +4,17 @@ Get bot information
 Displays bot username, ID, and capabilities
 """
 
-import asyncio
 import sys
-from telegram_bot import TelegramBotWrapper
+from _raw_api import call, load_config
 
 
-async def main():
+def main():
     """Display bot information"""
     print("🤖 Telegram Bot Information\n")
 
     try:
-        bot = TelegramBotWrapper()
-        info = await bot.get_me()
+        config = load_config()
+        info = call("getMe", token=config['TELEGRAM_BOT_TOKEN'])
 
         print("📋 Bot Details:\n")
         print(f"   Bot ID: {info['id']}")
@@ -25,9 +24,9 @@ async def main():
         print()
 
         print("⚙️  Capabilities:\n")
-        print(f"   Can Join Groups: {'✅ Yes' if info['can_join_groups'] else '❌ No'}")
-        print(f"   Can Read All Group Messages: {'✅ Yes' if info['can_read_all_group_messages'] else '❌ No'}")
-        print(f"   Supports Inline Queries: {'✅ Yes' if info['supports_inline_queries'] else '❌ No'}")
+        print(f"   Can Join Groups: {'✅ Yes' if info.get('can_join_groups') else '❌ No'}")
+        print(f"   Can Read All Group Messages: {'✅ Yes' if info.get('can_read_all_group_messages') else '❌ No'}")
+        print(f"   Supports Inline Queries: {'✅ Yes' if info.get('supports_inline_queries') else '❌ No'}")
         print()
 
         print("🔗 Bot Link:")
@@ -35,8 +34,8 @@ async def main():
         print()
 
         # Check default chat ID
-        if bot.default_chat_id:
-            print(f"💬 Default Chat ID: {bot.default_chat_id}")
+        if config['DEFAULT_CHAT_ID']:
+            print(f"💬 Default Chat ID: {config['DEFAULT_CHAT_ID']}")
             print("   (Set in .env file)")
         else:
             print("💡 No default chat ID set")
@@ -52,4 +51,4 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    main()
@@ -4,10 +4,32 @@ Contact management system for Telegram Bot
 Allows users to save and use friendly names instead of chat IDs
 """
 
+import contextlib
+import functools
 import json
+import mmap
+import os
 import sys
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to stdlib json
+    orjson = None
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@functools.lru_cache(maxsize=1)
+def _rapidfuzz():
+    """rapidfuzz's (fuzz, process) modules, or None if it isn't installed"""
+    # Imported on first search so sending by name doesn't pay for it
+    try:
+        from rapidfuzz import fuzz, process
+    except ImportError:  # optional, falls back to substring search
+        return None
+    return fuzz, process
 
 
 class ContactManager:
@@ -16,25 +38,146 @@ class ContactManager:
     def __init__(self, storage_file: Optional[str] = None):
         if storage_file is None:
             # Store in project root
-            project_root = Path(__file__).parent.parent
-            storage_file = project_root / "contacts.json"
+            storage_file = _PROJECT_ROOT / "contacts.json"
 
         self.storage_file = Path(storage_file)
-        self.contacts = self._load()
+        self._in_batch = False
+        self._dirty = False
+
+        # Contacts are stored column-wise; row i of every list is one contact
+        self._keys: List[str] = []  # lowercased name, the lookup key
+        self._names: List[str] = []
+        self._chat_ids: List[str] = []
+        self._types: List[str] = []
+        self._titles: List[Optional[str]] = []
+        self._index: Dict[str, int] = {}  # key -> row
+        self._gram_index: Dict[str, List[str]] = {}  # 1-3 char substring -> keys
+
+        for contact in self._load().values():
+            # Re-derive keys so key == name.lower() holds even for hand-edited files
+            name_lower = self._key(contact["name"])
+            if name_lower in self._index:
+                self._delete_row(name_lower)
+            self._append_row(
+                name_lower, contact["name"], contact["chat_id"],
+                contact["type"], contact.get("title")
+            )
+
+    @property
+    def contacts(self) -> Dict[str, Dict]:
+        """All contacts keyed by lowercased name, in storage order"""
+        return {key: self._row(row) for row, key in enumerate(self._keys)}
+
+    def _row(self, row: int) -> Dict:
+        """Materialize one contact as a dict"""
+        return {
+            "name": self._names[row],
+            "chat_id": self._chat_ids[row],
+            "type": self._types[row],
+            "title": self._titles[row]
+        }
+
+    def _append_row(self, name_lower: str, name: str, chat_id: str,
+                    chat_type: str, title: Optional[str]):
+        """Store a new contact as the last row"""
+        self._index[name_lower] = len(self._keys)
+        self._keys.append(name_lower)
+        self._names.append(name)
+        self._chat_ids.append(chat_id)
+        self._types.append(chat_type)
+        self._titles.append(title)
+        self._index_add(name_lower)
+
+    def _delete_row(self, name_lower: str):
+        """Remove a contact, keeping the remaining rows in storage order"""
+        row = self._index.pop(name_lower)
+        self._index_remove(name_lower)
+
+        for column in (self._keys, self._names, self._chat_ids, self._types, self._titles):
+            del column[row]
+        # Rows after the removed one each moved up by one
+        for i in range(row, len(self._keys)):
+            self._index[self._keys[i]] = i
 
     def _load(self) -> Dict:
         """Load contacts from file"""
         if self.storage_file.exists():
             try:
-                return json.loads(self.storage_file.read_text())
+                if orjson is not None:
+                    return self._load_mapped()
+                return json.loads(self.storage_file.read_bytes())
             except json.JSONDecodeError:
                 print(f"Warning: Could not parse {self.storage_file}, starting fresh")
                 return {}
         return {}
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _key(name: str) -> str:
+        """Storage key for a contact name"""
+        return name.lower()
+
+    def _load_mapped(self) -> Dict:
+        """Parse the storage file straight from a read-only memory map"""
+        with open(self.storage_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap refuses empty files; let orjson report the parse error
+                return orjson.loads(b'')
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
+    @staticmethod
+    def _grams(name_lower: str) -> set:
+        """Every 1-3 char substring of a key"""
+        return {
+            name_lower[i:i + n]
+            for n in range(1, 4)
+            for i in range(len(name_lower) - n + 1)
+        }
+
+    def _index_add(self, name_lower: str):
+        """Register a contact in the substring index"""
+        for gram in self._grams(name_lower):
+            self._gram_index.setdefault(gram, []).append(name_lower)
+
+    def _index_remove(self, name_lower: str):
+        """Drop a contact from the substring index"""
+        for gram in self._grams(name_lower):
+            keys = self._gram_index.get(gram)
+            if keys is None:
+                continue
+            keys.remove(name_lower)
+            if not keys:
+                del self._gram_index[gram]
+
+    @contextlib.contextmanager
+    def _batched(self):
+        """Defer writes until the block exits, then save once if anything changed"""
+        self._in_batch = True
+        self._dirty = False
+        try:
+            yield
+        finally:
+            self._in_batch = False
+            if self._dirty:
+                self._save()
+
     def _save(self):
         """Save contacts to file"""
-        self.storage_file.write_text(json.dumps(self.contacts, indent=2, ensure_ascii=False))
+        if self._in_batch:
+            self._dirty = True
+            return
+
+        if orjson is not None:
+            data = orjson.dumps(self.contacts, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.contacts, indent=2, ensure_ascii=False).encode('utf-8')
+
+        # Write to a sibling temp file and swap it in so readers never see a partial file
+        tmp_file = self.storage_file.with_name(self.storage_file.name + '.tmp')
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, self.storage_file)
 
     def add(self, name: str, chat_id: str, chat_type: str = "private", title: Optional[str] = None) -> bool:
         """
@@ -49,44 +192,58 @@ class ContactManager:
         Returns:
             True if new contact, False if updated existing
         """
-        name_lower = name.lower()
-        is_new = name_lower not in self.contacts
-
-        self.contacts[name_lower] = {
-            "name": name,  # Keep original case
-            "chat_id": str(chat_id),
-            "type": chat_type,
-            "title": title
-        }
+        name_lower = self._key(name)
+        row = self._index.get(name_lower)
+        is_new = row is None
+
+        if is_new:
+            # Keep original case in the name column
+            self._append_row(name_lower, name, str(chat_id), chat_type, title)
+        elif self._row(row) == {"name": name, "chat_id": str(chat_id), "type": chat_type, "title": title}:
+            # Identical record, nothing to write
+            return False
+        else:
+            # The key is unchanged, so its index entries stay valid
+            self._names[row] = name
+            self._chat_ids[row] = str(chat_id)
+            self._types[row] = chat_type
+            self._titles[row] = title
 
         self._save()
         return is_new
 
     def remove(self, name: str) -> bool:
         """Remove a contact by name"""
-        name_lower = name.lower()
-        if name_lower in self.contacts:
-            del self.contacts[name_lower]
+        name_lower = self._key(name)
+        if name_lower in self._index:
+            self._delete_row(name_lower)
             self._save()
             return True
         return False
 
     def get_chat_id(self, name: str) -> Optional[str]:
         """Get chat ID by name"""
-        name_lower = name.lower()
-        if name_lower in self.contacts:
-            return self.contacts[name_lower]["chat_id"]
+        row = self._index.get(self._key(name))
+        if row is not None:
+            return self._chat_ids[row]
         return None
 
     def get_contact(self, name: str) -> Optional[Dict]:
         """Get full contact info by name"""
-        name_lower = name.lower()
-        return self.contacts.get(name_lower)
+        row = self._index.get(self._key(name))
+        if row is not None:
+            return self._row(row)
+        return None
 
     def search(self, query: str) -> List[Dict]:
         """
         Search contacts by partial name match
 
+        Matches names containing the query anywhere. An exact name
+        match, if any, is listed first.
+        If rapidfuzz is installed, matching is fuzzy instead, so typos
+        like "jhon" still find "John"; best matches come first.
+
         Args:
             query: Search term
 
@@ -94,17 +251,64 @@ class ContactManager:
             List of matching contacts
         """
         query_lower = query.lower()
-        results = []
-
-        for name_lower, contact in self.contacts.items():
-            if query_lower in name_lower or query_lower in contact["name"].lower():
-                results.append(contact)
+        if not query_lower:
+            return [self._row(row) for row in range(len(self._keys))]
+
+        index = self._index
+        exact = index.get(query_lower)
+
+        rapidfuzz = _rapidfuzz()
+        if rapidfuzz is not None:
+            fuzz, process = rapidfuzz
+            matches = process.extract(
+                query_lower, self._keys, scorer=fuzz.partial_ratio,
+                limit=None, score_cutoff=70
+            )
+            rows = [row for _, _, row in matches]
+        else:
+            # Every key containing the query also contains its first three
+            # characters, so the index narrows the scan without missing matches.
+            # Keys are the lowercased name, so one containment check covers both.
+            candidates = self._gram_index.get(query_lower[:3], ())
+            rows = [index[key] for key in candidates if query_lower in key]
 
-        return results
+        if exact is not None:
+            rows = [exact] + [row for row in rows if row != exact]
+        return [self._row(row) for row in rows]
 
     def list_all(self) -> List[Dict]:
         """Get all contacts sorted by name"""
-        return sorted(self.contacts.values(), key=lambda x: x["name"].lower())
+        # The key column already holds each name lowercased
+        rows = sorted(range(len(self._keys)), key=self._keys.__getitem__)
+        return [self._row(row) for row in rows]
+
+    def import_chat(self, chat: Dict) -> bool:
+        """
+        Import a single chat as a contact unless its name is already taken
+
+        Args:
+            chat: Chat dictionary as found in update['message']['chat']
+
+        Returns:
+            True if a new contact was added
+        """
+        chat_id = str(chat['id'])
+        chat_type = chat['type']
+
+        # Generate a friendly name
+        if chat_type == 'private':
+            # Use first name or username
+            name = chat.get('first_name') or chat.get('username') or f"User_{chat_id}"
+            title = f"{chat.get('first_name', '')} {chat.get('last_name', '')}".strip()
+        else:
+            # Use group/channel title
+            name = chat.get('title') or f"{chat_type}_{chat_id}"
+            title = chat.get('title')
+
+        # Only import if not already exists
+        if self.get_chat_id(name) is not None:
+            return False
+        return self.add(name, chat_id, chat_type, title)
 
     def import_from_chats(self, chats: List[Dict]):
         """
@@ -115,28 +319,64 @@ class ContactManager:
         """
         imported = 0
 
-        for chat_info in chats:
-            chat = chat_info['chat']
-            chat_id = str(chat['id'])
-            chat_type = chat['type']
-
-            # Generate a friendly name
-            if chat_type == 'private':
-                # Use first name or username
-                name = chat.get('first_name') or chat.get('username') or f"User_{chat_id}"
-                title = f"{chat.get('first_name', '')} {chat.get('last_name', '')}".strip()
-            else:
-                # Use group/channel title
-                name = chat.get('title') or f"{chat_type}_{chat_id}"
-                title = chat.get('title')
-
-            # Only import if not already exists
-            if self.get_chat_id(name) is None:
-                self.add(name, chat_id, chat_type, title)
-                imported += 1
+        with self._batched():
+            for chat_info in chats:
+                imported += self.import_chat(chat_info['chat'])
 
         return imported
 
+    def import_from_updates(self, updates: List[Dict]) -> Tuple[int, int]:
+        """
+        Import the chat of every message in a list of updates
+
+        Each chat is considered once, in a single pass, and contacts.json
+        is written at most once at the end.
+
+        Args:
+            updates: Updates as returned by TelegramBotWrapper.get_updates
+
+        Returns:
+            (number of contacts added, number of distinct chats seen)
+        """
+        seen = set()
+        imported = 0
+
+        with self._batched():
+            for update in updates:
+                if 'message' not in update:
+                    continue
+                chat = update['message']['chat']
+                if chat['id'] in seen:
+                    continue
+                seen.add(chat['id'])
+                imported += self.import_chat(chat)
+
+        return imported, len(seen)
+
+
+def import_chats():
+    """Import contacts from recent chats"""
+    import asyncio
+    from _updates import cached_get_updates
+
+    async def run():
+        # Fetch updates and load contacts.json at the same time
+        updates_task = asyncio.create_task(cached_get_updates())
+        manager = await asyncio.to_thread(ContactManager)
+        updates = await updates_task
+
+        # Import and save off the event loop
+        imported, chat_count = await asyncio.to_thread(manager.import_from_updates, updates)
+
+        print(f"✅ Imported {imported} new contact(s) from {chat_count} chat(s)")
+        print("\n💡 View contacts: python scripts/contacts.py list")
+
+    try:
+        asyncio.run(run())
+    except Exception as e:
+        print(f"❌ Failed to import: {e}")
+        sys.exit(1)
+
 
 def main():
     """CLI for contact management"""
@@ -175,6 +415,10 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    if args.command == 'import':
+        import_chats()
+        return
+
     manager = ContactManager()
 
     if args.command == 'add':
@@ -198,15 +442,17 @@ def main():
             print("   1. Run: python scripts/contacts.py import")
             print("   2. Or add manually: python scripts/contacts.py add <name> <chat_id>")
         else:
-            print(f"\n📇 Contacts ({len(contacts)}):\n")
+            # Buffer the listing and write it in one go
+            out = [f"\n📇 Contacts ({len(contacts)}):\n"]
             for contact in contacts:
                 icon = "👤" if contact['type'] == 'private' else "👥"
-                print(f"{icon} {contact['name']}")
-                print(f"   Chat ID: {contact['chat_id']}")
-                print(f"   Type: {contact['type']}")
+                out.append(f"{icon} {contact['name']}")
+                out.append(f"   Chat ID: {contact['chat_id']}")
+                out.append(f"   Type: {contact['type']}")
                 if contact.get('title'):
-                    print(f"   Title: {contact['title']}")
-                print()
+                    out.append(f"   Title: {contact['title']}")
+                out.append("")
+            sys.stdout.write("\n".join(out) + "\n")
 
     elif args.command == 'search':
         results = manager.search(args.query)
@@ -226,37 +472,6 @@ def main():
             print(f"❌ Contact not found: {args.name}", file=sys.stderr)
             sys.exit(1)
 
-    elif args.command == 'import':
-        # Import from recent chats
-        import asyncio
-        from telegram_bot import TelegramBotWrapper
-
-        async def import_chats():
-            bot = TelegramBotWrapper()
-            updates = await bot.get_updates()
-
-            # Extract unique chats
-            chats = {}
-            for update in updates:
-                if 'message' in update:
-                    msg = update['message']
-                    chat_info = msg['chat']
-                    chat_id = chat_info['id']
-                    if chat_id not in chats:
-                        chats[chat_id] = {'chat': chat_info, 'from': msg.get('from')}
-
-            chat_list = list(chats.values())
-            imported = manager.import_from_chats(chat_list)
-
-            print(f"✅ Imported {imported} new contact(s) from {len(chat_list)} chat(s)")
-            print("\n💡 View contacts: python scripts/contacts.py list")
-
-        try:
-            asyncio.run(import_chats())
-        except Exception as e:
-            print(f"❌ Failed to import: {e}")
-            sys.exit(1)
-
 
 if __name__ == '__main__':
     try:
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Optional long-lived helper process
+Keeps contacts and the bot's HTTP connection pool warm between CLI calls
+
+Start it with:
+    python scripts/daemon.py
+
+While it runs, send_message.py sends through it and skips loading
+python-telegram-bot and the TCP/TLS handshake. Requests are JSON lines
+over a Unix socket, e.g. {"cmd": "get", "name": "John"}, and contact
+names are resolved from the daemon's already loaded contacts.
+"""
+
+import asyncio
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+
+SOCKET_PATH = Path.home() / ".cache" / "telegram-bot" / "daemon.sock"
+
+
+def request(payload: Dict[str, Any], timeout: float = 60) -> Optional[Any]:
+    """
+    Send one request to a running daemon
+
+    Args:
+        payload: Request object with a 'cmd' key
+        timeout: Socket timeout in seconds
+
+    Returns:
+        The daemon's result, or None if no daemon is listening
+
+    Raises:
+        RuntimeError: The daemon took the request but failed or never replied
+    """
+    if not hasattr(socket, 'AF_UNIX') or not SOCKET_PATH.exists():
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(SOCKET_PATH))
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+        except OSError:
+            # Stale socket file, no permission, daemon gone: callers fall back
+            return None
+
+        # The request may already be running, so retrying elsewhere could repeat it
+        try:
+            with sock.makefile('rb') as reader:
+                line = reader.readline()
+        except OSError as e:
+            raise RuntimeError(f"Daemon did not reply: {e}") from e
+
+    if not line:
+        raise RuntimeError("Daemon closed the connection without replying")
+
+    try:
+        response = json.loads(line)
+    except ValueError as e:
+        raise RuntimeError(f"Unreadable daemon reply: {e}") from e
+    if not response.get('ok'):
+        raise RuntimeError(response.get('error', 'Unknown daemon error'))
+    return response['result']
+
+
+class Daemon:
+    """Serve contact lookups and sends from one warm process"""
+
+    def __init__(self):
+        from contacts import ContactManager
+        from telegram_bot import TelegramBotWrapper
+
+        self.manager = ContactManager()
+        self.bot = TelegramBotWrapper()
+        self._contacts_mtime = self._storage_mtime()
+
+    def _storage_mtime(self) -> Optional[float]:
+        try:
+            return self.manager.storage_file.stat().st_mtime
+        except OSError:
+            return None
+
+    def _refresh_contacts(self):
+        """Reload contacts if another process changed contacts.json"""
+        mtime = self._storage_mtime()
+        if mtime != self._contacts_mtime:
+            from contacts import ContactManager
+
+            self.manager = ContactManager(self.manager.storage_file)
+            self._contacts_mtime = mtime
+
+    async def dispatch(self, payload: Dict[str, Any]) -> Any:
+        """Run a single request"""
+        cmd = payload.get('cmd')
+
+        if cmd in ('get', 'search'):
+            self._refresh_contacts()
+            if cmd == 'get':
+                # Wrapped so a missing contact isn't mistaken for a missing daemon
+                return {'chat_id': self.manager.get_chat_id(payload['name'])}
+            return self.manager.search(payload['query'])
+
+        if cmd == 'send':
+            from telegram.constants import ParseMode
+
+            parse_mode = {
+                'markdown': ParseMode.MARKDOWN_V2,
+                'html': ParseMode.HTML
+            }.get(payload.get('format'))
+
+            result = await self.bot.send_message(
+                text=payload['text'],
+                chat_id=payload.get('chat_id'),
+                parse_mode=parse_mode
+            )
+            return result.to_dict()
+
+        if cmd == 'ping':
+            return 'pong'
+
+        raise ValueError(f"Unknown command: {cmd}")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer each JSON line on a connection"""
+        try:
+            while line := await reader.readline():
+                try:
+                    result = await self.dispatch(json.loads(line))
+                    response = {'ok': True, 'result': result}
+                except Exception as e:
+                    response = {'ok': False, 'error': str(e)}
+
+                writer.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self):
+        SOCKET_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        SOCKET_PATH.unlink(missing_ok=True)
+
+        server = await asyncio.start_unix_server(self.handle, path=str(SOCKET_PATH))
+        SOCKET_PATH.chmod(0o600)
+
+        print(f"🟢 Daemon listening on {SOCKET_PATH}")
+        print("   Press Ctrl+C to stop")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            SOCKET_PATH.unlink(missing_ok=True)
+
+
+def main():
+    """Run the daemon"""
+    if not hasattr(socket, 'AF_UNIX'):
+        print("❌ The daemon needs Unix domain sockets, which this platform lacks")
+        sys.exit(1)
+
+    try:
+        daemon = Daemon()
+    except ValueError as e:
+        print(f"❌ Configuration Error: {e}")
+        print("\n💡 Run 'python scripts/init_bot.py' to set up your bot")
+        sys.exit(1)
+
+    asyncio.run(daemon.serve())
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\nDaemon stopped.")
+        sys.exit(0)
@@ -3,13 +3,12 @@
 Get information about a specific chat
 """
 
-import asyncio
 import sys
 import argparse
-from telegram_bot import TelegramBotWrapper
+from _raw_api import call
 
 
-async def main():
+def main():
     """Get chat information"""
     parser = argparse.ArgumentParser(description='Get chat information')
     parser.add_argument('--chat-id', type=str, required=True, help='Chat ID to query')
@@ -19,8 +18,7 @@ async def main():
     print(f"🔍 Fetching information for chat {args.chat_id}...\n")
 
     try:
-        bot = TelegramBotWrapper()
-        info = await bot.get_chat(args.chat_id)
+        info = call("getChat", chat_id=args.chat_id)
 
         print("✅ Chat Information:\n")
         print(f"   Chat ID: {info['id']}")
@@ -54,4 +52,4 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    main()
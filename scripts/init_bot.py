@@ -9,13 +9,14 @@ import sys
 from pathlib import Path
 
 
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
 def init_bot():
     """Initialize bot configuration"""
     print("🤖 Telegram Bot Initialization\n")
 
-    # Get project root
-    project_root = Path(__file__).parent.parent
-    env_file = project_root / ".env"
+    env_file = _PROJECT_ROOT / ".env"
 
     # Check if .env already exists
     if env_file.exists():
@@ -62,7 +63,7 @@ TELEGRAM_BOT_TOKEN={bot_token}
     print("\n⚠️  Security reminder: Never commit the .env file!")
 
     # Create .gitignore if it doesn't exist
-    gitignore_file = project_root / ".gitignore"
+    gitignore_file = _PROJECT_ROOT / ".gitignore"
     if not gitignore_file.exists():
         with open(gitignore_file, 'w') as f:
             f.write(".env\n__pycache__/\n*.pyc\n.DS_Store\n")
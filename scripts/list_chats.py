@@ -6,7 +6,7 @@ Useful for discovering chat IDs
 
 import asyncio
 import sys
-from telegram_bot import TelegramBotWrapper
+from _updates import cached_get_updates, extract_unique_chats
 
 
 async def main():
@@ -14,8 +14,7 @@ async def main():
     print("📋 Fetching recent chats...\n")
 
     try:
-        bot = TelegramBotWrapper()
-        updates = await bot.get_updates()
+        updates = await cached_get_updates()
 
         if not updates:
             print("📭 No recent messages found.")
@@ -27,44 +26,33 @@ async def main():
 
         print(f"✅ Found {len(updates)} recent update(s)\n")
 
-        # Extract unique chats
-        chats = {}
-        for update in updates:
-            if 'message' in update:
-                msg = update['message']
-                chat_info = msg['chat']
-                chat_id = chat_info['id']
-
-                if chat_id not in chats:
-                    chats[chat_id] = {
-                        'chat': chat_info,
-                        'from': msg.get('from'),
-                        'latest_text': msg.get('text', '(no text)'),
-                        'update_id': update['update_id']
-                    }
+        chats = extract_unique_chats(updates)
 
         print(f"📬 Unique Chats ({len(chats)}):\n")
 
+        # Buffer the listing and write it in one go
+        out = []
         for i, (chat_id, info) in enumerate(chats.items(), 1):
             chat = info['chat']
-            print(f"{i}. Chat ID: {chat_id}")
-            print(f"   Type: {chat['type']}")
+            out.append(f"{i}. Chat ID: {chat_id}")
+            out.append(f"   Type: {chat['type']}")
 
             if chat['type'] == 'private':
-                print(f"   User: {chat.get('first_name', 'N/A')} (@{chat.get('username', 'N/A')})")
+                out.append(f"   User: {chat.get('first_name', 'N/A')} (@{chat.get('username', 'N/A')})")
             elif chat['type'] in ['group', 'supergroup']:
-                print(f"   Group: {chat.get('title', 'N/A')}")
+                out.append(f"   Group: {chat.get('title', 'N/A')}")
                 if chat.get('username'):
-                    print(f"   Username: @{chat['username']}")
+                    out.append(f"   Username: @{chat['username']}")
             elif chat['type'] == 'channel':
-                print(f"   Channel: {chat.get('title', 'N/A')}")
+                out.append(f"   Channel: {chat.get('title', 'N/A')}")
 
             if info['from']:
                 from_user = info['from']
-                print(f"   Last From: {from_user.get('first_name', 'N/A')} (@{from_user.get('username', 'N/A')})")
+                out.append(f"   Last From: {from_user.get('first_name', 'N/A')} (@{from_user.get('username', 'N/A')})")
 
-            print(f"   Latest: {info['latest_text'][:50]}...")
-            print()
+            out.append(f"   Latest: {info['latest_text'][:50]}...")
+            out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
 
         print("💡 To send a message, use:")
         print(f"   python scripts/send_message.py --chat-id <CHAT_ID> --message \"Your message\"")
@@ -4,9 +4,11 @@ Send a file/document via Telegram Bot
 """
 
 import asyncio
+import os
+import stat
 import sys
 import argparse
-from pathlib import Path
+from datetime import datetime, timezone
 from telegram_bot import TelegramBotWrapper
 
 
@@ -33,13 +35,16 @@ async def main():
         sys.exit(1)
 
     # Verify file exists
-    file_path = Path(args.file)
-    if not file_path.exists():
+    try:
+        st = os.stat(args.file)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         print(f"❌ File not found: {args.file}")
         sys.exit(1)
 
     # Get file size
-    file_size = file_path.stat().st_size
+    file_size = st.st_size
     file_size_mb = file_size / (1024 * 1024)
 
     if file_size_mb > 50:
@@ -47,12 +52,12 @@ async def main():
         print("   Telegram bot API has a 50 MB file size limit")
         print("   Consider using a file hosting service for larger files")
 
-    print(f"📤 Sending file: {file_path.name} ({file_size_mb:.2f} MB)...")
+    print(f"📤 Sending file: {os.path.basename(args.file)} ({file_size_mb:.2f} MB)...")
 
     try:
         bot = TelegramBotWrapper()
         result = await bot.send_document(
-            document_path=str(file_path),
+            document_path=args.file,
             chat_id=chat_id,
             caption=args.caption
         )
@@ -60,7 +65,7 @@ async def main():
         print(f"✅ File sent successfully!")
         print(f"   Message ID: {result['message_id']}")
         print(f"   Chat ID: {result['chat_id']}")
-        print(f"   Time: {result['date']}")
+        print(f"   Time: {datetime.fromtimestamp(result['date'], timezone.utc).isoformat()}")
 
     except ValueError as e:
         print(f"❌ Configuration Error: {e}")
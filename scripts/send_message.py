@@ -7,9 +7,29 @@ Supports sending by chat ID, contact name, or using default
 import asyncio
 import sys
 import argparse
-from telegram.constants import ParseMode
-from telegram_bot import TelegramBotWrapper
+from datetime import datetime, timezone
 from contacts import ContactManager
+from daemon import request as daemon_request
+from telegram_bot import TelegramBotWrapper, _CHAT_ID_RE
+
+
+async def send_direct(text, chat_id, message_format):
+    """Send in-process, used when no daemon is running"""
+    from telegram.constants import ParseMode
+
+    # Determine parse mode
+    parse_mode = None
+    if message_format == 'markdown':
+        parse_mode = ParseMode.MARKDOWN_V2
+    elif message_format == 'html':
+        parse_mode = ParseMode.HTML
+
+    bot = TelegramBotWrapper()
+    return await bot.send_message(
+        text=text,
+        chat_id=chat_id,
+        parse_mode=parse_mode
+    )
 
 
 async def main():
@@ -25,13 +45,6 @@ async def main():
 
     args = parser.parse_args()
 
-    # Determine parse mode
-    parse_mode = None
-    if args.format == 'markdown':
-        parse_mode = ParseMode.MARKDOWN_V2
-    elif args.format == 'html':
-        parse_mode = ParseMode.HTML
-
     # Determine chat ID
     chat_id = None
     contact_name = None
@@ -40,15 +53,27 @@ async def main():
         chat_id = None  # Will use default from bot wrapper
     elif args.to:
         # Check if it's a chat ID (numeric or starts with -)
-        if args.to.lstrip('-').isdigit():
+        if _CHAT_ID_RE.fullmatch(args.to):
             chat_id = args.to
         else:
             # Treat as contact name
             contact_name = args.to
-            manager = ContactManager()
-            chat_id = manager.get_chat_id(contact_name)
+            # Ask a running daemon first; it keeps contacts.json loaded
+            manager = None
+            try:
+                reply = daemon_request({'cmd': 'get', 'name': contact_name}, timeout=5)
+            except RuntimeError:
+                # A lookup is safe to repeat locally
+                reply = None
+            if reply is not None:
+                chat_id = reply['chat_id']
+            else:
+                manager = ContactManager()
+                chat_id = manager.get_chat_id(contact_name)
 
             if chat_id is None:
+                if manager is None:
+                    manager = ContactManager()
                 print(f"❌ Contact not found: {contact_name}")
                 print("\n💡 Available contacts:")
                 contacts = manager.list_all()
@@ -80,19 +105,22 @@ async def main():
         print(f"📤 Sending message...")
 
     try:
-        bot = TelegramBotWrapper()
-        result = await bot.send_message(
-            text=args.message,
-            chat_id=chat_id,
-            parse_mode=parse_mode
-        )
+        # Reuse a running daemon's warm connection if there is one
+        result = daemon_request({
+            'cmd': 'send',
+            'text': args.message,
+            'chat_id': chat_id,
+            'format': args.format
+        })
+        if result is None:
+            result = await send_direct(args.message, chat_id, args.format)
 
         print(f"✅ Message sent successfully!")
         if contact_name:
             print(f"   To: {contact_name}")
         print(f"   Message ID: {result['message_id']}")
         print(f"   Chat ID: {result['chat_id']}")
-        print(f"   Time: {result['date']}")
+        print(f"   Time: {datetime.fromtimestamp(result['date'], timezone.utc).isoformat()}")
 
     except ValueError as e:
         print(f"❌ Configuration Error: {e}")
@@ -4,9 +4,11 @@ Send a photo via Telegram Bot
 """
 
 import asyncio
+import os
+import stat
 import sys
 import argparse
-from pathlib import Path
+from datetime import datetime, timezone
 from telegram_bot import TelegramBotWrapper
 
 
@@ -33,31 +35,37 @@ async def main():
         sys.exit(1)
 
     # Verify file exists
-    photo_path = Path(args.photo)
-    if not photo_path.exists():
+    try:
+        st = os.stat(args.photo)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         print(f"❌ Photo not found: {args.photo}")
         sys.exit(1)
 
+    photo_name = os.path.basename(args.photo)
+    suffix = os.path.splitext(photo_name)[1]
+
     # Check file extension
     valid_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']
-    if photo_path.suffix.lower() not in valid_extensions:
-        print(f"⚠️  Warning: {photo_path.suffix} might not be a valid image format")
+    if suffix.lower() not in valid_extensions:
+        print(f"⚠️  Warning: {suffix} might not be a valid image format")
         print(f"   Valid formats: {', '.join(valid_extensions)}")
 
     # Get file size
-    file_size = photo_path.stat().st_size
+    file_size = st.st_size
     file_size_mb = file_size / (1024 * 1024)
 
     if file_size_mb > 10:
         print(f"⚠️  Warning: Photo is {file_size_mb:.2f} MB")
         print("   Telegram recommends photos under 10 MB for best quality")
 
-    print(f"📤 Sending photo: {photo_path.name}...")
+    print(f"📤 Sending photo: {photo_name}...")
 
     try:
         bot = TelegramBotWrapper()
         result = await bot.send_photo(
-            photo_path=str(photo_path),
+            photo_path=args.photo,
             chat_id=chat_id,
             caption=args.caption
         )
@@ -65,7 +73,7 @@ async def main():
         print(f"✅ Photo sent successfully!")
         print(f"   Message ID: {result['message_id']}")
         print(f"   Chat ID: {result['chat_id']}")
-        print(f"   Time: {result['date']}")
+        print(f"   Time: {datetime.fromtimestamp(result['date'], timezone.utc).isoformat()}")
 
     except ValueError as e:
         print(f"❌ Configuration Error: {e}")
@@ -6,13 +6,24 @@ Send a message with inline keyboard buttons
 import asyncio
 import sys
 import argparse
+from typing import List, Tuple
 from telegram_bot import TelegramBotWrapper
 
+try:
+    from itertools import batched
+except ImportError:  # Python < 3.12
+    def batched(iterable, n):
+        items = list(iterable)
+        return (tuple(items[i:i + n]) for i in range(0, len(items), n))
 
-async def main():
-    """Send message with buttons"""
+
+def _parse() -> argparse.Namespace:
+    """Parse command-line arguments"""
     parser = argparse.ArgumentParser(description='Send a message with inline buttons')
-    parser.add_argument('--chat-id', type=str, help='Target chat ID')
+    parser.add_argument('--chat-id', type=str, action='append',
+                        help='Target chat ID (repeat to send to several chats)')
+    parser.add_argument('--chat-ids', type=str,
+                        help='Comma-separated chat IDs to broadcast to (e.g., "123,456,-100789")')
     parser.add_argument('--message', type=str, required=True, help='Message text')
     parser.add_argument('--buttons', type=str, required=True,
                         help='Button labels separated by commas (e.g., "Option 1,Option 2,Option 3")')
@@ -22,50 +33,84 @@ async def main():
                         help='Use default chat ID from .env')
 
     args = parser.parse_args()
+    if args.columns < 1:
+        parser.error("--columns must be at least 1")
+    return args
+
+
+def _validate(args: argparse.Namespace) -> Tuple[List[str], Tuple[Tuple[str, ...], ...]]:
+    """
+    Resolve chat IDs and button rows, exiting on bad input before any network code loads
 
-    # Determine chat ID
-    chat_id = None
-    if args.use_default:
-        chat_id = None  # Will use default from bot wrapper
-    elif args.chat_id:
-        chat_id = args.chat_id
+    Returns:
+        (target chat IDs, button label rows)
+    """
+    # Determine chat IDs
+    chat_ids = list(args.chat_id or [])
+    if args.chat_ids:
+        chat_ids += [cid.strip() for cid in args.chat_ids.split(',') if cid.strip()]
 
-    if not args.use_default and not chat_id:
-        print("❌ Please specify --chat-id or --use-default")
+    if not args.use_default and not chat_ids:
+        print("❌ Please specify --chat-id, --chat-ids or --use-default")
+        sys.exit(1)
+
+    if args.use_default and chat_ids:
+        print("❌ --use-default can't be combined with --chat-id or --chat-ids")
         sys.exit(1)
 
     # Parse button labels
     button_labels = [label.strip() for label in args.buttons.split(',')]
 
-    # Arrange buttons in rows
-    button_rows = []
-    for i in range(0, len(button_labels), args.columns):
-        row = button_labels[i:i + args.columns]
-        button_rows.append(row)
+    # Arrange buttons in rows (hashable, so the keyboard cache can reuse it)
+    return chat_ids, tuple(batched(button_labels, args.columns))
+
+
+async def _run(args: argparse.Namespace, chat_ids: List[str], button_rows: Tuple[Tuple[str, ...], ...]):
+    """Send message with buttons"""
+    button_labels = [label for row in button_rows for label in row]
 
     print(f"📤 Sending message with {len(button_labels)} button(s)...")
 
+    bot = None
     try:
-        bot = TelegramBotWrapper()
+        bot = TelegramBotWrapper.default()
 
         # Create inline keyboard
         keyboard = bot.create_inline_keyboard(button_rows)
 
         # Send message
-        result = await bot.send_message(
-            text=args.message,
-            chat_id=chat_id,
-            reply_markup=keyboard
-        )
-
-        print(f"✅ Message sent successfully!")
-        print(f"   Message ID: {result['message_id']}")
-        print(f"   Chat ID: {result['chat_id']}")
+        if args.use_default:
+            results = [await bot.send_message(
+                text=args.message,
+                reply_markup=keyboard
+            )]
+        else:
+            # Batched concurrent sends with flood-limit retry
+            results = await bot.send_message_bulk(
+                args.message,
+                chat_ids,
+                reply_markup=keyboard
+            )
+
+        failed = [(cid, r) for cid, r in zip(chat_ids, results) if isinstance(r, Exception)]
+        sent = [r for r in results if not isinstance(r, Exception)]
+
+        if sent:
+            print(f"✅ Message sent successfully!")
+        for result in sent:
+            print(f"   Message ID: {result['message_id']}")
+            print(f"   Chat ID: {result['chat_id']}")
         print(f"   Buttons: {', '.join(button_labels)}")
 
+        for chat_id, error in failed:
+            print(f"❌ Failed to send to {chat_id}: {error}")
+
         print("\n💡 Note: To handle button clicks, you need to implement")
         print("   callback query handling in a bot listener script.")
 
+        if failed:
+            sys.exit(1)
+
     except ValueError as e:
         print(f"❌ Configuration Error: {e}")
         print("\n💡 Run 'python scripts/init_bot.py' to set up your bot")
@@ -73,7 +118,19 @@ async def main():
     except Exception as e:
         print(f"❌ Failed to send message: {e}")
         sys.exit(1)
+    finally:
+        # Close connections inside this event loop, which owns them
+        if bot is not None:
+            await bot.shutdown()
+
+
+def main():
+    """Parse and validate arguments, then send"""
+    # argparse and validation errors exit before an event loop or the bot is created
+    args = _parse()
+    chat_ids, button_rows = _validate(args)
+    asyncio.run(_run(args, chat_ids, button_rows))
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    main()
@@ -5,78 +5,428 @@ Provides high-level interface to Telegram Bot API
 """
 
 import os
+import re
+import json
+import asyncio
 import logging
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from telegram import Bot, Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.constants import ParseMode
-from telegram.error import TelegramError
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING, ClassVar, Optional, List, Dict, Any, BinaryIO, Sequence, Tuple, Union
+from dotenv import dotenv_values, find_dotenv
+
+# python-telegram-bot is imported inside the methods that need it, so
+# importing this module (e.g. for --help or config errors) stays cheap
+if TYPE_CHECKING:
+    from telegram import Bot, InlineKeyboardMarkup, InputFile
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to stdlib json
+    orjson = None
 
 
 # Configure logging
+# CLI scripts stay quiet unless LOGLEVEL (e.g. INFO, DEBUG) is set
+_log_level = os.environ.get('LOGLEVEL', 'WARNING').upper()
+if not isinstance(logging.getLevelName(_log_level), int):
+    # Unknown names would make basicConfig raise before any script can report it
+    _log_level = 'WARNING'
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
+    level=_log_level
 )
 logger = logging.getLogger(__name__)
 
 
+def _find_env_file() -> str:
+    """Locate .env: the project's own file, else the nearest one above the working directory"""
+    project_env = Path(__file__).resolve().parent.parent / ".env"
+    if project_env.is_file():
+        return str(project_env)
+    return find_dotenv(usecwd=True)
+
+
+# Looked up once per process; empty if there is no .env file
+_ENV_FILE = _find_env_file()
+
+# get_chat results are reused for this long, for up to this many chats
+_CHAT_CACHE_TTL = 300
+_CHAT_CACHE_SIZE = 1024
+
+# (media kind, absolute path, mtime, size) of an uploaded file. The kind is
+# part of the key because a photo's file_id can't be sent as a document
+_FileKey = Tuple[str, str, float, int]
+
+# A numeric chat ID or an @channelusername
+ChatId = Union[int, str]
+
+_CHAT_ID_RE = re.compile(r'-?\d+')
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env(env_path: str) -> Dict[str, Optional[str]]:
+    """Parse a .env file once per process"""
+    return dotenv_values(env_path)
+
+
+def _normalize_chat_id(chat_id: Optional[str]) -> Optional[ChatId]:
+    """Turn a numeric chat ID setting into an int; keep @usernames as strings"""
+    if not chat_id:
+        return None
+    return int(chat_id) if _CHAT_ID_RE.fullmatch(chat_id) else chat_id
+
+
+def _env(env: Dict[str, Optional[str]], key: str) -> Optional[str]:
+    """Look up a setting; real environment variables win over .env"""
+    return os.environ.get(key, env.get(key))
+
+
+def _resolve_chat(method):
+    """
+    Fill in the default chat when a send method gets chat_id=None
+
+    chat_id may be passed by keyword or positionally; its position is
+    looked up once, when the method is decorated.
+    """
+    # Index into *args, which doesn't include self
+    pos = list(inspect.signature(method).parameters).index('chat_id') - 1
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        positional = len(args) > pos
+        if (args[pos] if positional else kwargs.get('chat_id')) is None:
+            chat_id = self.default_chat_id
+            if chat_id is None:
+                raise ValueError("No chat_id provided and no default chat_id set")
+            if positional:
+                args = (*args[:pos], chat_id, *args[pos + 1:])
+            else:
+                kwargs['chat_id'] = chat_id
+        return await method(self, *args, **kwargs)
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=64)
+def _build_keyboard(buttons: Tuple[Tuple[str, ...], ...]) -> "InlineKeyboardMarkup":
+    """Build (and memoize) a keyboard; markups are immutable, so sharing is safe"""
+    from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+    button = InlineKeyboardButton
+    # Use label as both display text and callback data
+    return InlineKeyboardMarkup(
+        [[button(label, callback_data=label) for label in row] for row in buttons]
+    )
+
+
+# Fields kept from each message when flattening updates
+_MSG_KEYS = ('message_id', 'date', 'text')
+_CHAT_KEYS = ('id', 'type', 'title', 'username', 'first_name', 'last_name')
+_USER_KEYS = ('id', 'is_bot', 'first_name', 'username')
+
+
+def _project_update(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Slice a raw update dict down to the fields callers use"""
+    result = {'update_id': data['update_id']}
+
+    msg = data.get('message')
+    if msg is not None:
+        message = {key: msg.get(key) for key in _MSG_KEYS}
+        chat = msg['chat']
+        message['chat'] = {key: chat.get(key) for key in _CHAT_KEYS}
+        sender = msg.get('from')
+        message['from'] = {key: sender.get(key) for key in _USER_KEYS} if sender else None
+        result['message'] = message
+
+    return result
+
+
+class _Record:
+    """Dict-style read access so callers can keep using result['field']"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+@dataclass(slots=True, frozen=True)
+class SentMessage(_Record):
+    """A message the bot sent"""
+    message_id: int
+    chat_id: int
+    date: int  # Unix timestamp
+    text: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'message_id': self.message_id,
+            'chat_id': self.chat_id,
+            'date': self.date,
+            'text': self.text
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class BotInfo(_Record):
+    """The bot's own account details"""
+    id: int
+    username: str
+    first_name: str
+    is_bot: bool
+    can_join_groups: Optional[bool]
+    can_read_all_group_messages: Optional[bool]
+    supports_inline_queries: Optional[bool]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'username': self.username,
+            'first_name': self.first_name,
+            'is_bot': self.is_bot,
+            'can_join_groups': self.can_join_groups,
+            'can_read_all_group_messages': self.can_read_all_group_messages,
+            'supports_inline_queries': self.supports_inline_queries
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class ChatInfo(_Record):
+    """Details of a chat"""
+    id: int
+    type: str
+    title: Optional[str]
+    username: Optional[str]
+    first_name: Optional[str]
+    last_name: Optional[str]
+    description: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'type': self.type,
+            'title': self.title,
+            'username': self.username,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'description': self.description
+        }
+
+
+class RawBot:
+    """
+    Minimal async client for the HTTP Bot API that returns plain JSON
+
+    Skips building PTB Update/Message/User objects, for callers (like
+    polling) that only want dicts. One httpx client is kept for the
+    lifetime of the instance so the TCP/TLS connection is reused.
+    """
+
+    API_URL = "https://api.telegram.org/bot{token}/"
+
+    def __init__(self, token: str):
+        import httpx
+
+        self._client = httpx.AsyncClient(
+            base_url=self.API_URL.format(token=token),
+            timeout=httpx.Timeout(30, connect=10)
+        )
+
+    async def call(self, method: str, read_timeout: Optional[float] = None, **params) -> Any:
+        """
+        Call a Bot API method
+
+        Args:
+            method: API method name, e.g. 'getUpdates'
+            read_timeout: Override the read timeout for this request
+            **params: Method parameters; None values are dropped
+
+        Returns:
+            The 'result' field of the response
+        """
+        import httpx
+        from telegram.error import NetworkError, TelegramError
+
+        payload = {key: value for key, value in params.items() if value is not None}
+        body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+        timeout = httpx.Timeout(read_timeout, connect=10) if read_timeout is not None else httpx.USE_CLIENT_DEFAULT
+
+        try:
+            response = await self._client.post(
+                method, content=body, headers={'Content-Type': 'application/json'}, timeout=timeout
+            )
+        except httpx.HTTPError as e:
+            # Same shape as PTB's own transport errors
+            raise NetworkError(f"httpx.{e.__class__.__name__}: {e}") from e
+
+        try:
+            data = orjson.loads(response.content) if orjson is not None else json.loads(response.content)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            # Telegram reports API errors as JSON; anything else is a proxy or outage page
+            raise NetworkError(f"HTTP {response.status_code}: {response.reason_phrase}")
+
+        if not data.get('ok'):
+            raise TelegramError(data.get('description', 'Unknown error'))
+        return data['result']
+
+    async def get_updates(
+        self,
+        offset: Optional[int] = None,
+        timeout: int = 10,
+        allowed_updates: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch raw update dicts"""
+        # Give the long poll room to finish before httpx gives up on the read
+        return await self.call(
+            'getUpdates',
+            read_timeout=timeout + 10,
+            offset=offset,
+            timeout=timeout,
+            allowed_updates=list(allowed_updates) if allowed_updates is not None else None
+        )
+
+    async def aclose(self):
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
+
+
 class TelegramBotWrapper:
     """High-level wrapper for Telegram Bot operations"""
 
-    def __init__(self, token: Optional[str] = None):
+    _default: ClassVar[Optional["TelegramBotWrapper"]] = None
+
+    def __init__(self, token: Optional[str] = None, connection_pool_size: int = 32):
         """
         Initialize bot wrapper
 
         Args:
             token: Bot token. If None, loads from .env file
+            connection_pool_size: Max concurrent HTTP connections for API calls,
+                so sends gathered with asyncio run in parallel
         """
+        env: Dict[str, Optional[str]] = {}
         if token is None:
             # Load from .env
-            project_root = Path(__file__).parent.parent
-            env_file = project_root / ".env"
-
-            if not env_file.exists():
+            if not _ENV_FILE:
                 raise ValueError(
                     "No bot token provided and .env file not found. "
                     "Run 'python scripts/init_bot.py' first."
                 )
 
-            load_dotenv(env_file)
-            token = os.getenv('TELEGRAM_BOT_TOKEN')
+            env = _load_env(_ENV_FILE)
+            token = _env(env, 'TELEGRAM_BOT_TOKEN')
 
             if not token:
                 raise ValueError("TELEGRAM_BOT_TOKEN not found in .env file")
 
-        self.bot = Bot(token=token)
-        self.default_chat_id = os.getenv('DEFAULT_CHAT_ID')
+        self._token = token
+        self._pool_size = connection_pool_size
+        self._bot: Optional["Bot"] = None
+        self._bot_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._raw: Optional[RawBot] = None
+        self._raw_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._file_id_cache: Dict[_FileKey, str] = {}
+        self._chat_cache: "OrderedDict[ChatId, Tuple[float, ChatInfo]]" = OrderedDict()
+        # Normalized once here so sends don't re-parse it on every call
+        self.default_chat_id: Optional[ChatId] = _normalize_chat_id(_env(env, 'DEFAULT_CHAT_ID'))
         logger.info("TelegramBotWrapper initialized")
 
-    async def get_me(self) -> Dict[str, Any]:
+    @classmethod
+    def default(cls) -> "TelegramBotWrapper":
+        """
+        Return a process-wide wrapper configured from .env
+
+        Scripts and harnesses that chain several commands in one process
+        share its settings and caches. Connections still belong to one event
+        loop: call shutdown() before that loop ends.
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @property
+    def token(self) -> str:
+        """Bot token this wrapper uses"""
+        return self._token
+
+    @property
+    def bot(self) -> "Bot":
+        """
+        The PTB Bot for the running event loop
+
+        Pooled connections belong to the loop that opened them, so a wrapper
+        used again under a new asyncio.run() builds a fresh Bot rather than
+        reusing connections from a closed loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if self._bot is None or self._bot_loop is not loop:
+            from telegram import Bot
+            from telegram.request import HTTPXRequest
+
+            request = HTTPXRequest(
+                connection_pool_size=self._pool_size,
+                pool_timeout=20,
+                read_timeout=30,
+                connect_timeout=10
+            )
+            self._bot = Bot(token=self._token, request=request)
+            self._bot_loop = loop
+
+        return self._bot
+
+    async def shutdown(self):
+        """Close the HTTP connections held by this wrapper; it can still be used afterwards"""
+        if self._bot is not None:
+            bot, self._bot = self._bot, None
+            await bot.request.shutdown()
+
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            await raw.aclose()
+
+    async def get_me(self) -> BotInfo:
         """Get bot information"""
+        from telegram.error import TelegramError
+
         try:
             me = await self.bot.get_me()
-            return {
-                'id': me.id,
-                'username': me.username,
-                'first_name': me.first_name,
-                'is_bot': me.is_bot,
-                'can_join_groups': me.can_join_groups,
-                'can_read_all_group_messages': me.can_read_all_group_messages,
-                'supports_inline_queries': me.supports_inline_queries
-            }
+            return BotInfo(
+                me.id,
+                me.username,
+                me.first_name,
+                me.is_bot,
+                me.can_join_groups,
+                me.can_read_all_group_messages,
+                me.supports_inline_queries
+            )
         except TelegramError as e:
-            logger.error(f"Failed to get bot info: {e}")
+            logger.error("Failed to get bot info: %s", e)
             raise
 
+    @_resolve_chat
     async def send_message(
         self,
         text: str,
-        chat_id: Optional[str] = None,
+        chat_id: Optional[ChatId] = None,
         parse_mode: Optional[str] = None,
-        reply_markup: Optional[InlineKeyboardMarkup] = None
-    ) -> Dict[str, Any]:
+        reply_markup: Optional["InlineKeyboardMarkup"] = None
+    ) -> SentMessage:
         """
         Send a text message
 
@@ -89,10 +439,21 @@ class TelegramBotWrapper:
         Returns:
             Message information
         """
-        if chat_id is None:
-            chat_id = self.default_chat_id
-            if chat_id is None:
-                raise ValueError("No chat_id provided and no default chat_id set")
+        return await self._send_one(
+            text, chat_id,
+            parse_mode=parse_mode,
+            reply_markup=reply_markup
+        )
+
+    async def _send_one(
+        self,
+        text: str,
+        chat_id: ChatId,
+        parse_mode: Optional[str] = None,
+        reply_markup: Optional["InlineKeyboardMarkup"] = None
+    ) -> SentMessage:
+        """Send a text message to an already resolved chat ID"""
+        from telegram.error import RetryAfter, TelegramError
 
         try:
             message = await self.bot.send_message(
@@ -102,170 +463,309 @@ class TelegramBotWrapper:
                 reply_markup=reply_markup
             )
 
-            logger.info(f"Message sent to {chat_id}: {message.message_id}")
+            logger.info("Message sent to %s: %s", chat_id, message.message_id)
 
-            return {
-                'message_id': message.message_id,
-                'chat_id': message.chat.id,
-                'date': message.date.isoformat(),
-                'text': message.text
-            }
+            return SentMessage(
+                message.message_id,
+                message.chat.id,
+                int(message.date.timestamp()),
+                message.text
+            )
+        except RetryAfter as e:
+            # Not an error yet: send_message_bulk retries these
+            logger.debug("Flood limit hit sending to %s, retry after %ss", chat_id, e.retry_after)
+            raise
         except TelegramError as e:
-            logger.error(f"Failed to send message: {e}")
+            logger.error("Failed to send message: %s", e)
             raise
 
+    async def send_message_bulk(
+        self,
+        text: str,
+        chat_ids: Sequence[ChatId],
+        *,
+        batch_size: int = 25,
+        delay: float = 1.0,
+        **kwargs
+    ) -> List[Union[SentMessage, Exception]]:
+        """
+        Send the same text message to many chats
+
+        Chats are sent to in concurrent batches of batch_size, pausing
+        delay seconds between batches to stay under Telegram's flood
+        limits. Sends rejected with RetryAfter are retried once after
+        the requested wait.
+
+        Args:
+            text: Message text
+            chat_ids: Target chat IDs
+            batch_size: Number of concurrent sends per batch
+            delay: Seconds to wait between batches
+            **kwargs: parse_mode / reply_markup, as for send_message
+
+        Returns:
+            One entry per chat ID, in order: message information, or the
+            exception that made that send fail
+        """
+        from telegram.error import RetryAfter
+
+        results: List[Union[SentMessage, Exception]] = []
+
+        for i in range(0, len(chat_ids), batch_size):
+            batch = chat_ids[i:i + batch_size]
+            batch_results = await asyncio.gather(
+                *(self._send_one(text, chat_id, **kwargs) for chat_id in batch),
+                return_exceptions=True
+            )
+
+            retry = [j for j, result in enumerate(batch_results) if isinstance(result, RetryAfter)]
+            if retry:
+                wait = max(batch_results[j].retry_after for j in retry)
+                logger.warning("Flood limit hit, retrying %d message(s) in %ss", len(retry), wait)
+                await asyncio.sleep(wait)
+                retried = await asyncio.gather(
+                    *(self._send_one(text, batch[j], **kwargs) for j in retry),
+                    return_exceptions=True
+                )
+                for j, result in zip(retry, retried):
+                    batch_results[j] = result
+
+            results.extend(batch_results)
+
+            if i + batch_size < len(chat_ids):
+                await asyncio.sleep(delay)
+
+        return results
+
+    def _media(
+        self,
+        source: Union[str, os.PathLike, BinaryIO],
+        kind: str
+    ) -> Tuple[Union[str, "InputFile"], Optional[_FileKey]]:
+        """
+        Work out what to send for a path or open file
+
+        Args:
+            source: Path (str or os.PathLike) or open binary file
+            kind: 'photo' or 'document', the send method the result is for
+
+        InputFile takes in the whole content when it is built, so a path is
+        opened and closed again here, before the upload is awaited.
+
+        Returns:
+            The file_id of an earlier upload of the same unchanged path, or an
+            InputFile, plus the cache key to store the new file_id under
+            (None when nothing needs caching)
+        """
+        from telegram import InputFile
+
+        if not isinstance(source, (str, os.PathLike)):
+            return InputFile(source), None
+
+        path = os.path.abspath(source)
+        st = os.stat(path)
+        key = (kind, path, st.st_mtime, st.st_size)
+        file_id = self._file_id_cache.get(key)
+        if file_id is not None:
+            return file_id, None
+
+        with open(path, 'rb') as f:
+            return InputFile(f, filename=os.path.basename(path)), key
+
+    @_resolve_chat
     async def send_photo(
         self,
-        photo_path: str,
-        chat_id: Optional[str] = None,
+        photo_path: Union[str, os.PathLike, BinaryIO],
+        chat_id: Optional[ChatId] = None,
         caption: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Send a photo"""
-        if chat_id is None:
-            chat_id = self.default_chat_id
-            if chat_id is None:
-                raise ValueError("No chat_id provided and no default chat_id set")
+    ) -> SentMessage:
+        """
+        Send a photo
+
+        Args:
+            photo_path: Path to the photo, or an open binary file owned by the caller.
+                Resending an unchanged path reuses the earlier upload's file_id
+            chat_id: Target chat ID. Uses default if None
+            caption: Optional photo caption
+
+        Returns:
+            Message information
+        """
+        from telegram.error import TelegramError
 
         try:
-            with open(photo_path, 'rb') as photo:
-                message = await self.bot.send_photo(
-                    chat_id=chat_id,
-                    photo=photo,
-                    caption=caption
-                )
+            # Open and read off the event loop so concurrent sends keep running
+            photo, key = await asyncio.to_thread(self._media, photo_path, 'photo')
+            message = await self.bot.send_photo(
+                chat_id=chat_id,
+                photo=photo,
+                caption=caption
+            )
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Photo sent to %s: %s", chat_id, message.message_id)
 
-            logger.info(f"Photo sent to {chat_id}: {message.message_id}")
+            if key is not None:
+                self._file_id_cache[key] = message.photo[-1].file_id
 
-            return {
-                'message_id': message.message_id,
-                'chat_id': message.chat.id,
-                'date': message.date.isoformat()
-            }
+            return SentMessage(
+                message.message_id,
+                message.chat.id,
+                int(message.date.timestamp())
+            )
         except TelegramError as e:
-            logger.error(f"Failed to send photo: {e}")
+            logger.error("Failed to send photo: %s", e)
             raise
         except FileNotFoundError:
-            logger.error(f"Photo file not found: {photo_path}")
+            logger.error("Photo file not found: %s", photo_path)
             raise
 
+    @_resolve_chat
     async def send_document(
         self,
-        document_path: str,
-        chat_id: Optional[str] = None,
+        document_path: Union[str, os.PathLike, BinaryIO],
+        chat_id: Optional[ChatId] = None,
         caption: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Send a document/file"""
-        if chat_id is None:
-            chat_id = self.default_chat_id
-            if chat_id is None:
-                raise ValueError("No chat_id provided and no default chat_id set")
+    ) -> SentMessage:
+        """
+        Send a document/file
+
+        Args:
+            document_path: Path to the file, or an open binary file owned by the caller.
+                Resending an unchanged path reuses the earlier upload's file_id
+            chat_id: Target chat ID. Uses default if None
+            caption: Optional file caption
+
+        Returns:
+            Message information
+        """
+        from telegram.error import TelegramError
 
         try:
-            with open(document_path, 'rb') as document:
-                message = await self.bot.send_document(
-                    chat_id=chat_id,
-                    document=document,
-                    caption=caption
-                )
+            # Open and read off the event loop so concurrent sends keep running
+            document, key = await asyncio.to_thread(self._media, document_path, 'document')
+            message = await self.bot.send_document(
+                chat_id=chat_id,
+                document=document,
+                caption=caption
+            )
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Document sent to %s: %s", chat_id, message.message_id)
 
-            logger.info(f"Document sent to {chat_id}: {message.message_id}")
+            if key is not None:
+                self._file_id_cache[key] = message.document.file_id
 
-            return {
-                'message_id': message.message_id,
-                'chat_id': message.chat.id,
-                'date': message.date.isoformat()
-            }
+            return SentMessage(
+                message.message_id,
+                message.chat.id,
+                int(message.date.timestamp())
+            )
         except TelegramError as e:
-            logger.error(f"Failed to send document: {e}")
+            logger.error("Failed to send document: %s", e)
             raise
         except FileNotFoundError:
-            logger.error(f"Document file not found: {document_path}")
+            logger.error("Document file not found: %s", document_path)
             raise
 
-    async def get_updates(self, offset: Optional[int] = None) -> List[Dict[str, Any]]:
+    async def get_updates(
+        self,
+        offset: Optional[int] = None,
+        *,
+        allowed_updates: Optional[Sequence[str]] = None,
+        timeout: int = 50
+    ) -> List[Dict[str, Any]]:
         """
         Get updates (messages, etc.)
 
+        Long-polls: when nothing is pending, Telegram holds the request open
+        for up to `timeout` seconds and answers as soon as an update arrives.
+
         Args:
             offset: Identifier of the first update to be returned
+            allowed_updates: Update types to receive, e.g. ("message",). Telegram
+                remembers the list for the bot and applies it to later polls
+                that leave it unset, so only long-running pollers should pass
+                one. None keeps the bot's current setting
+            timeout: Long-polling timeout in seconds (0 for a short poll)
 
         Returns:
-            List of updates
+            List of updates; message dates are Unix timestamps
         """
+        from telegram.error import TelegramError
+
         try:
-            updates = await self.bot.get_updates(offset=offset, timeout=10)
-
-            results = []
-            for update in updates:
-                update_dict = {
-                    'update_id': update.update_id
-                }
-
-                if update.message:
-                    msg = update.message
-                    update_dict['message'] = {
-                        'message_id': msg.message_id,
-                        'date': msg.date.isoformat(),
-                        'chat': {
-                            'id': msg.chat.id,
-                            'type': msg.chat.type,
-                            'title': msg.chat.title,
-                            'username': msg.chat.username,
-                            'first_name': msg.chat.first_name
-                        },
-                        'from': {
-                            'id': msg.from_user.id,
-                            'is_bot': msg.from_user.is_bot,
-                            'first_name': msg.from_user.first_name,
-                            'username': msg.from_user.username
-                        } if msg.from_user else None,
-                        'text': msg.text
-                    }
-
-                results.append(update_dict)
-
-            return results
+            # Like the Bot, the raw client's connections can't outlive their loop
+            loop = asyncio.get_running_loop()
+            if self._raw is None or self._raw_loop is not loop:
+                self._raw = RawBot(self._token)
+                self._raw_loop = loop
+
+            # Poll the HTTP API directly; the JSON already has the shape we return
+            updates = await self._raw.get_updates(
+                offset=offset,
+                timeout=timeout,
+                allowed_updates=allowed_updates
+            )
+
+            return [_project_update(update) for update in updates]
         except TelegramError as e:
-            logger.error(f"Failed to get updates: {e}")
+            logger.error("Failed to get updates: %s", e)
             raise
 
-    async def get_chat(self, chat_id: str) -> Dict[str, Any]:
-        """Get information about a chat"""
+    async def get_chat(self, chat_id: ChatId) -> ChatInfo:
+        """
+        Get information about a chat
+
+        Results are cached per chat for a few minutes, since chat metadata
+        rarely changes during a run. Failed lookups are not cached.
+        """
+        key = str(chat_id)
+        now = time.monotonic()
+
+        entry = self._chat_cache.get(key)
+        if entry is not None and now - entry[0] < _CHAT_CACHE_TTL:
+            self._chat_cache.move_to_end(key)
+            return entry[1]
+
+        info = await self._fetch_chat(chat_id)
+
+        self._chat_cache[key] = (now, info)
+        self._chat_cache.move_to_end(key)
+        if len(self._chat_cache) > _CHAT_CACHE_SIZE:
+            self._chat_cache.popitem(last=False)
+
+        return info
+
+    async def _fetch_chat(self, chat_id: ChatId) -> ChatInfo:
+        """Fetch chat information from Telegram"""
+        from telegram.error import TelegramError
+
         try:
             chat = await self.bot.get_chat(chat_id=chat_id)
 
-            result = {
-                'id': chat.id,
-                'type': chat.type,
-                'title': chat.title,
-                'username': chat.username,
-                'first_name': chat.first_name,
-                'last_name': chat.last_name,
-                'description': chat.description
-            }
-
-            return result
+            return ChatInfo(
+                chat.id,
+                chat.type,
+                chat.title,
+                chat.username,
+                chat.first_name,
+                chat.last_name,
+                chat.description
+            )
         except TelegramError as e:
-            logger.error(f"Failed to get chat info: {e}")
+            logger.error("Failed to get chat info: %s", e)
             raise
 
-    def create_inline_keyboard(self, buttons: List[List[str]]) -> InlineKeyboardMarkup:
+    def create_inline_keyboard(self, buttons: Sequence[Sequence[str]]) -> "InlineKeyboardMarkup":
         """
         Create an inline keyboard
 
         Args:
-            buttons: 2D list of button labels
+            buttons: 2D list (or tuple) of button labels
                 Example: [['Button 1', 'Button 2'], ['Button 3']]
 
         Returns:
             InlineKeyboardMarkup object
         """
-        keyboard = []
-        for row in buttons:
-            keyboard_row = []
-            for label in row:
-                # Use label as both display text and callback data
-                keyboard_row.append(InlineKeyboardButton(label, callback_data=label))
-            keyboard.append(keyboard_row)
-
-        return InlineKeyboardMarkup(keyboard)
+        return _build_keyboard(tuple(tuple(row) for row in buttons))
@@ -4,19 +4,43 @@ Test Telegram Bot connection
 Verifies bot token is valid and bot is accessible
 """
 
+import argparse
 import asyncio
+import json
 import sys
 from telegram_bot import TelegramBotWrapper
 
 
+def write_json(obj):
+    """Write obj to stdout as one JSON line, using orjson when installed"""
+    try:
+        import orjson
+    except ImportError:
+        sys.stdout.write(json.dumps(obj) + "\n")
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE))
+
+
 async def main():
     """Test bot connection"""
-    print("🔍 Testing Telegram Bot connection...\n")
+    parser = argparse.ArgumentParser(description='Test Telegram bot connection')
+    parser.add_argument('--json', action='store_true',
+                        help='Print bot info as JSON for scripts')
+    args = parser.parse_args()
 
+    if not args.json:
+        print("🔍 Testing Telegram Bot connection...\n")
+
+    bot = None
     try:
-        bot = TelegramBotWrapper()
+        bot = TelegramBotWrapper.default()
         info = await bot.get_me()
 
+        if args.json:
+            write_json({'ok': True, **info.to_dict(), 'default_chat_id': bot.default_chat_id})
+            return
+
         print("✅ Bot connection successful!\n")
         print("📋 Bot Information:")
         print(f"   ID: {info['id']}")
@@ -34,13 +58,23 @@ async def main():
             print("\n💡 Tip: Set a default chat ID in .env for easier messaging")
 
     except ValueError as e:
+        if args.json:
+            write_json({'ok': False, 'error': f"Configuration Error: {e}"})
+            sys.exit(1)
         print(f"❌ Configuration Error: {e}")
         print("\n💡 Run 'python scripts/init_bot.py' to set up your bot")
         sys.exit(1)
     except Exception as e:
+        if args.json:
+            write_json({'ok': False, 'error': f"Connection Failed: {e}"})
+            sys.exit(1)
         print(f"❌ Connection Failed: {e}")
         print("\n💡 Check your bot token and internet connection")
         sys.exit(1)
+    finally:
+        # Close connections inside this event loop, which owns them
+        if bot is not None:
+            await bot.shutdown()
 
 
 if __name__ == '__main__':